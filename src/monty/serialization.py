@@ -2,52 +2,144 @@
 
 from __future__ import annotations
 
+import bz2
+import functools
+import gzip
+import io
+import itertools
 import json
+import lzma
+import mmap
 import os
 import pathlib
+import re
 import threading
-from typing import TYPE_CHECKING, Literal, TextIO, cast
-
-from ruamel.yaml import YAML
+from typing import IO, TYPE_CHECKING, Literal, TextIO, cast
 
 from monty.io import zopen
 from monty.json import MontyDecoder, MontyEncoder, MSONable
 from monty.msgpack import default, object_hook
 
+try:
+    import bson
+except ImportError:
+    bson = None
+
 try:
     import msgpack
 except ImportError:
     msgpack = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
     from typing import Any
 
+    from ruamel.yaml import YAML
+
     from monty.shutil import PathLike
 
 _FILE_TYPE = Literal["json", "jsonl", "yaml", "mpk"]
 
-# Bridge the JSON ``TypeHandler`` plugin registry into ruamel.yaml so MSONable
-# subclasses and every registered handler type (numpy, pandas, pint, torch,
-# uuid, bson, user-registered) round-trip through ``dumpfn`` / ``loadfn`` the
-# same way they do via JSON. ruamel.yaml retains its native rendering for
-# types it already supports (datetime, set, OrderedDict, bytes, primitives).
+# Format by (lower-case) file extension; anything else is treated as JSON.
+_FORMAT_BY_EXT: dict[str, _FILE_TYPE] = {
+    "mpk": "mpk",
+    "yaml": "yaml",
+    "yml": "yaml",
+    "jsonl": "jsonl",
+    "json": "json",
+}
+_COMPRESSED_EXTS = frozenset({"gz", "bz2", "xz", "lzma", "z"})
+# Length of the longest recognized suffix, e.g. ``".jsonl.lzma"``.
+_MAX_SUFFIX_LEN = 2 + max(map(len, _FORMAT_BY_EXT)) + max(map(len, _COMPRESSED_EXTS))
+
+# Number of JSON-lines records encoded per ``write`` call in ``dumpfn``.
+_JSONL_WRITE_CHUNK = 1024
+
+# Uncompressed JSON files above this size are memory-mapped rather than read.
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Read buffer for compressed inputs, matching CPython 3.12's
+# ``gzip.READ_BUFFER_SIZE``.
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Compressed streams that only buffer ``io.DEFAULT_BUFFER_SIZE`` (8 KiB) of
+# decompressed data. ``GzipFile`` already buffers ``gzip.READ_BUFFER_SIZE``
+# from Python 3.12 on.
+_SMALL_BUFFER_STREAMS: tuple[type[bz2.BZ2File | lzma.LZMAFile | gzip.GzipFile], ...] = (
+    bz2.BZ2File,
+    lzma.LZMAFile,
+)
+if not hasattr(gzip, "READ_BUFFER_SIZE"):
+    _SMALL_BUFFER_STREAMS += (gzip.GzipFile,)
+
+# Bridge the JSON ``TypeHandler`` plugin registry into the YAML dumpers so
+# MSONable subclasses and every registered handler type (numpy, pandas, pint,
+# torch, uuid, bson, user-registered) round-trip through ``dumpfn`` /
+# ``loadfn`` the same way they do via JSON. The YAML backend retains its
+# native rendering for types it already supports (datetime, primitives, ...).
+# The same encoder backs ``dumpfn``'s JSON path when no options are given.
 _MONTY_ENCODER = MontyEncoder()
+# Shared by ``loadfn``: ``MontyDecoder.process_decoded`` keeps no state.
+_MONTY_DECODER = MontyDecoder()
 
 
 def _represent_via_monty(representer: Any, data: Any) -> Any:
     """Encode ``data`` via :class:`MontyEncoder` and represent the result.
 
-    Used as a ruamel.yaml multi-representer for ``MSONable`` / ``PurePath``
-    and as the fallback for the ``None``-keyed dispatch slot (replacing
-    ``represent_undefined``). The encoder returns a JSON-compatible value —
-    typically a dict with ``@module``/``@class`` — which ruamel.yaml then
-    represents recursively, so nested non-native types route through the
-    same hook.
+    Registered on both YAML backends (PyYAML's ``_MontyYAMLDumper`` and
+    ruamel.yaml's representer) as the multi-representer for ``MSONable`` /
+    ``PurePath`` and as the fallback for the ``None``-keyed dispatch slot
+    (replacing ``represent_undefined``). The encoder returns a
+    JSON-compatible value — typically a dict with ``@module``/``@class`` —
+    which the representer then represents recursively, so nested non-native
+    types route through the same hook.
     """
     return representer.represent_data(_MONTY_ENCODER.default(data))
 
 
+@functools.cache
+def _ruamel_representer() -> type:
+    """Build ruamel.yaml's safe representer with monty's MSONable/PurePath hooks.
+
+    ruamel.yaml is imported here rather than at module level, so JSON-only
+    users (and everyone with PyYAML installed) never pay for importing it.
+    Registering on a subclass (rather than through ``YAML().representer``,
+    whose ``add_*`` classmethods mutate ruamel.yaml's shared representer
+    class) keeps the hooks out of other ``YAML`` instances in the process.
+    """
+    from ruamel.yaml.representer import SafeRepresenter  # local import — cold path
+
+    class _MontySafeRepresenter(SafeRepresenter):
+        def represent_undefined(self, data: Any) -> Any:
+            """Try MontyEncoder before raising ``RepresenterError``."""
+            try:
+                return _represent_via_monty(self, data)
+            except TypeError:
+                return super().represent_undefined(data)
+
+    _MontySafeRepresenter.add_multi_representer(MSONable, _represent_via_monty)
+    # Paths would otherwise hit ruamel.yaml's default ``str(obj)`` fallback,
+    # which is lossy on load. Route them through the PathHandler envelope.
+    _MontySafeRepresenter.add_multi_representer(pathlib.PurePath, _represent_via_monty)
+    # The ``None`` slot is invoked when neither yaml_representers nor
+    # yaml_multi_representers match.
+    _MontySafeRepresenter.add_representer(
+        None, _MontySafeRepresenter.represent_undefined
+    )
+    return _MontySafeRepresenter
+
+
 # ruamel.yaml's ``YAML`` instance holds mutable per-call state (parser,
 # composer, constructor, emitter, serializer, representer caches) bound to the
 # instance during ``load``/``dump``. Sharing a single instance across threads
@@ -58,35 +150,270 @@ _yaml_local = threading.local()
 
 
 def _build_yaml() -> YAML:
-    """Construct a YAML instance with monty's MSONable/PurePath representers."""
-    yaml = YAML()
-    yaml.representer.add_multi_representer(MSONable, _represent_via_monty)
-    # Paths would otherwise hit ruamel.yaml's default ``str(obj)`` fallback,
-    # which is lossy on load. Route them through the PathHandler envelope.
-    yaml.representer.add_multi_representer(pathlib.PurePath, _represent_via_monty)
-    # Replace the ``None`` slot — invoked when neither yaml_representers nor
-    # yaml_multi_representers match — with a hook that tries MontyEncoder first,
-    # falling back to the original ``represent_undefined`` (which raises
-    # ``RepresenterError``) if MontyEncoder cannot serialize the object either.
-    orig_represent_undefined = yaml.representer.yaml_representers[None]
-
-    def _represent_undefined(representer: Any, data: Any) -> Any:
-        try:
-            return _represent_via_monty(representer, data)
-        except TypeError:
-            return orig_represent_undefined(representer, data)
+    """Construct a safe YAML instance with monty's representers.
+
+    ``typ="safe"`` skips the round-trip comment/anchor bookkeeping and, with
+    ``pure=False``, uses the libyaml-backed ``ruamel.yaml.clib`` parser and
+    emitter when that is installed.
+    """
+    from ruamel.yaml import YAML  # local import — cold path
 
-    yaml.representer.yaml_representers[None] = _represent_undefined
-    return yaml
+    ryaml = YAML(typ="safe", pure=False)
+    ryaml.Representer = _ruamel_representer()
+    # Keep the block style and insertion order of the round-trip dumper.
+    ryaml.default_flow_style = False
+    ryaml.sort_base_mapping_type_on_output = False  # type: ignore[assignment]
+    return ryaml
 
 
 def _get_yaml() -> YAML:
     """Return the calling thread's YAML instance, constructing it on first use."""
-    yaml = getattr(_yaml_local, "yaml", None)
-    if yaml is None:
-        yaml = _build_yaml()
-        _yaml_local.yaml = yaml
-    return yaml
+    ryaml = getattr(_yaml_local, "yaml", None)
+    if ryaml is None:
+        ryaml = _build_yaml()
+        _yaml_local.yaml = ryaml
+    return ryaml
+
+
+# When PyYAML is installed, YAML goes through its libyaml-backed C loader and
+# dumper (pure-Python ``SafeLoader``/``SafeDumper`` if PyYAML was built without
+# libyaml). That parses several times faster than ruamel.yaml's safe loader,
+# which is pure Python unless ``ruamel.yaml.clib`` is installed. PyYAML creates
+# a fresh loader/dumper per call, so there is no shared state to race on.
+# ruamel.yaml remains the fallback.
+#
+# PyYAML resolves plain scalars with YAML 1.1 rules (``no``/``on`` are bools,
+# ``010`` is octal, ``1:30`` is sexagesimal), whereas ruamel.yaml uses YAML 1.2.
+# The loader below swaps in ruamel.yaml's YAML 1.2 bool/int/float resolvers so
+# both backends read the same document the same way.
+_YAML12_IMPLICIT_RESOLVERS = (
+    (
+        "tag:yaml.org,2002:bool",
+        re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+        list("tTfF"),
+    ),
+    (
+        "tag:yaml.org,2002:int",
+        re.compile(
+            r"""^(?:[-+]?0b[0-1_]+
+            |[-+]?0o?[0-7_]+
+            |[-+]?[0-9_]+
+            |[-+]?0x[0-9a-fA-F_]+)$""",
+            re.X,
+        ),
+        list("-+0123456789"),
+    ),
+    (
+        "tag:yaml.org,2002:float",
+        re.compile(
+            r"""^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+            |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+            |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+            |[-+]?\.(?:inf|Inf|INF)
+            |\.(?:nan|NaN|NAN))$""",
+            re.X,
+        ),
+        list("-+0123456789."),
+    ),
+)
+
+
+def _construct_yaml12_int(loader: Any, node: Any) -> int:
+    """Construct a YAML 1.2 int, where a bare leading zero is still decimal."""
+    value = loader.construct_scalar(node).replace("_", "")
+    sign = -1 if value[0] == "-" else 1
+    value = value.lstrip("-+")
+    if value[:2] in {"0b", "0o", "0x"}:
+        return sign * int(value, 0)
+    return sign * int(value)
+
+
+if yaml is not None:
+
+    class _MontyYAMLLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):  # type: ignore[misc]
+        """Safe YAML loader resolving plain scalars with YAML 1.2 rules."""
+
+    _YAML12_TAGS = {tag for tag, _, _ in _YAML12_IMPLICIT_RESOLVERS}
+    _MontyYAMLLoader.yaml_implicit_resolvers = {
+        first: [res for res in resolvers if res[0] not in _YAML12_TAGS]
+        for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+    }
+    for _tag, _regexp, _first in _YAML12_IMPLICIT_RESOLVERS:
+        _MontyYAMLLoader.add_implicit_resolver(_tag, _regexp, _first)
+    _MontyYAMLLoader.add_constructor("tag:yaml.org,2002:int", _construct_yaml12_int)
+    _YAML_LOADER = _MontyYAMLLoader
+
+    class _MontyYAMLDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):  # type: ignore[misc]
+        """Safe YAML dumper with monty's MSONable/PurePath representers."""
+
+        def represent_undefined(self, data: Any) -> Any:
+            """Try MontyEncoder before raising ``RepresenterError``."""
+            try:
+                return _represent_via_monty(self, data)
+            except TypeError:
+                return super().represent_undefined(data)
+
+    _MontyYAMLDumper.add_multi_representer(MSONable, _represent_via_monty)
+    _MontyYAMLDumper.add_multi_representer(pathlib.PurePath, _represent_via_monty)
+    # PyYAML's safe representer dispatches on exact type, so dict subclasses
+    # (``OrderedDict``, ``defaultdict``) would otherwise be rejected.
+    _MontyYAMLDumper.add_multi_representer(dict, yaml.SafeDumper.represent_dict)
+    _MontyYAMLDumper.add_representer(None, _MontyYAMLDumper.represent_undefined)
+    # Quote strings that look like scalars under either YAML 1.1 or 1.2 (e.g.
+    # "no" and "1e3"), so the output round-trips through any YAML reader.
+    for _tag, _regexp, _first in _YAML12_IMPLICIT_RESOLVERS:
+        _MontyYAMLDumper.add_implicit_resolver(_tag, _regexp, _first)
+
+
+def _open_binary(fn: PathLike) -> IO[bytes]:
+    """Open ``fn`` for binary reading via ``zopen``.
+
+    bz2 and xz streams (and gzip before Python 3.12) are wrapped in a
+    ``_READ_BUFFER_SIZE`` buffer. Their own buffering hands out 8 KiB
+    blocks, so e.g. iterating lines of such a file would otherwise
+    decompress in many small calls. Other streams are returned as is.
+    """
+    fp = zopen(fn, mode="rb")
+    if isinstance(fp, _SMALL_BUFFER_STREAMS):
+        return io.BufferedReader(fp, buffer_size=_READ_BUFFER_SIZE)
+    return fp
+
+
+def _is_default_json_load(args: tuple, kwargs: dict) -> bool:
+    """Whether ``json.loads(..., **kwargs)`` may be replaced by :func:`_loads_json`.
+
+    That holds for the default decoder (or ``cls=None``) without extra
+    options.
+    """
+    return (
+        not args
+        and kwargs.keys() <= {"cls"}
+        and kwargs.get("cls", MontyDecoder) in {MontyDecoder, None}
+    )
+
+
+def _may_be_extended_json(data: bytes | mmap.mmap) -> bool:
+    """Whether ``data`` may hold MongoDB extended JSON that bson must parse."""
+    return bson is not None and data.find(b'"$') >= 0
+
+
+def _loads_json(data: bytes, decoder: MontyDecoder | None) -> Any:
+    """Parse JSON bytes and post-process them like ``decoder.decode``.
+
+    Parsing uses orjson when installed. It rejects some input the stdlib
+    accepts (``NaN``/``Infinity``, integers wider than 64 bits); those are
+    re-parsed with ``json`` so ``loadfn`` accepts exactly what it did before.
+
+    ``process_decoded`` only rebuilds dicts carrying an ``@module`` key, so
+    its recursive walk is skipped when that substring does not occur in the
+    raw input. A key spelled with JSON escapes (``"\\u0040module"``) is
+    therefore not decoded. Likewise, input is only handed to
+    ``decoder.decode`` (which parses MongoDB extended JSON when bson is
+    installed) if it contains a ``"$`` key prefix such as ``"$oid"``.
+    """
+    if decoder is not None and _may_be_extended_json(data):
+        return decoder.decode(data.decode())
+    if orjson is not None:
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            obj = json.loads(data)
+    else:
+        obj = json.loads(data)
+    if decoder is None or b"@module" not in data:
+        return obj
+    return decoder.process_decoded(obj)
+
+
+def _loads_json_file(fp: IO[bytes], decoder: MontyDecoder | None) -> Any:
+    """Parse a whole JSON file opened by :func:`_open_binary`.
+
+    Large uncompressed files are memory-mapped and passed to orjson as a
+    buffer, so the file's bytes come straight from the page cache instead of
+    being copied into a file-sized ``bytes`` object by ``read()``.
+    """
+    if (
+        orjson is not None
+        and isinstance(getattr(fp, "raw", None), io.FileIO)
+        and os.fstat(fp.fileno()).st_size > _MMAP_MIN_SIZE
+    ):
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if decoder is not None and _may_be_extended_json(mm):
+                return decoder.decode(mm[:].decode())
+            try:
+                with memoryview(mm) as view:
+                    obj = orjson.loads(view)
+            except orjson.JSONDecodeError:
+                # ``NaN``/big ints: only the stdlib parser accepts these.
+                obj = json.loads(mm[:])
+            if decoder is None or mm.find(b"@module") < 0:
+                return obj
+        return decoder.process_decoded(obj)
+    return _loads_json(fp.read(), decoder)
+
+
+def _iter_json_lines(fn: PathLike, decoder: MontyDecoder | None) -> Iterator[Any]:
+    """Lazily yield the decoded records of the JSON lines file ``fn``.
+
+    The file is opened before returning, so a missing file raises here rather
+    than on the first ``next()``. Only one record is held in memory at a time.
+    The file stays open until the iterator is exhausted or garbage-collected.
+    """
+    fp = _open_binary(fn)
+
+    def records() -> Iterator[Any]:
+        with fp:
+            for line in fp:
+                if not line.isspace():
+                    yield _loads_json(line, decoder)
+
+    return records()
+
+
+def _iter_json_array(fn: PathLike, decoder: MontyDecoder | None) -> Iterator[Any]:
+    """Lazily yield the decoded items of the top-level JSON array in ``fn``.
+
+    The file is opened and its root checked before returning, so a missing
+    file or a root that is not an array raises here rather than on the first
+    ``next()``. Only one item is held in memory at a time.
+    """
+    try:
+        import ijson  # local import — optional dependency
+    except ImportError:
+        raise RuntimeError(
+            "Streaming of JSON files is not possible as ijson is not installed."
+        ) from None
+
+    fp = _open_binary(fn)
+    try:
+        events = ijson.parse(fp, use_float=True)
+        first = next(events)
+        if first[1] != "start_array":
+            raise ValueError(f"Streaming requires a top-level JSON array in {fn}")
+    except BaseException:
+        fp.close()
+        raise
+
+    def items() -> Iterator[Any]:
+        with fp:
+            for item in ijson.items(itertools.chain([first], events), "item"):
+                yield item if decoder is None else decoder.process_decoded(item)
+
+    return items()
+
+
+@functools.lru_cache(maxsize=4096)
+def _identify_format_str(file_name: str) -> _FILE_TYPE:
+    """Cached implementation of :func:`_identify_format` for ``str`` paths."""
+    # One ``rpartition`` plus a dict lookup, stripping one layer of common
+    # compression suffixes so e.g. ``foo.json.gz`` is detected as JSON.
+    # Directory names never match: their "extension" would contain a separator.
+    # Only the tail that can hold a known suffix is lower-cased; a longer
+    # extension cut short by the slice has no dot left and falls to JSON.
+    head, sep, ext = file_name[-_MAX_SUFFIX_LEN:].lower().rpartition(".")
+    if ext in _COMPRESSED_EXTS:
+        head, sep, ext = head.rpartition(".")
+    return _FORMAT_BY_EXT.get(ext, "json") if sep else "json"
 
 
 def _identify_format(file_name: str | Path) -> _FILE_TYPE:
@@ -94,36 +421,24 @@ def _identify_format(file_name: str | Path) -> _FILE_TYPE:
 
     Detection is based on extension (suffix) rather than substring match so a
     file called ``"myjsonlist.json"`` is not mis-classified as JSON-lines and
-    ``"data.mpkfoo"`` is not classified as msgpack.
+    ``"data.mpkfoo"`` is not classified as msgpack. Results are cached per
+    path, as pipelines tend to load and dump the same file names repeatedly.
     """
-    # ``os.path.basename`` is fast and avoids a ``Path`` allocation. We strip
-    # one layer of common compression suffixes so e.g. ``foo.json.gz`` is
-    # detected as JSON.
-    basename = os.path.basename(str(file_name)).lower()
-    for compressed_ext in (".gz", ".bz2", ".xz", ".lzma", ".z"):
-        if basename.endswith(compressed_ext):
-            basename = basename[: -len(compressed_ext)]
-            break
-
-    if basename.endswith(".mpk"):
-        return "mpk"
-    if basename.endswith((".yaml", ".yml")):
-        return "yaml"
-    if basename.endswith(".jsonl"):
-        return "jsonl"
-    return "json"
+    return _identify_format_str(os.fspath(file_name))
 
 
 def loadfn(
     fn: PathLike,
     *args,
     fmt: _FILE_TYPE | None = None,
+    stream: bool = False,
     **kwargs,
 ) -> Any:
     """Load JSON/JSONL/YAML/msgpack from a filename.
 
     Supports BZ2 (``.bz2``), GZIP (``.gz``, ``.z``), XZ (``.xz``, ``.lzma``)
-    compressed inputs transparently. YAML support requires ``ruamel.yaml``.
+    compressed inputs transparently. YAML is parsed with PyYAML's C
+    ``CSafeLoader`` when PyYAML is installed, otherwise with ``ruamel.yaml``.
     Format is auto-detected from the (case-insensitive) extension: ``.yaml``
     / ``.yml`` → YAML; ``.mpk`` → msgpack; ``.jsonl`` → JSON lines; otherwise
     JSON.
@@ -133,14 +448,45 @@ def loadfn(
         *args: Any of the args supported by ``json``/``yaml``/``msgpack.load``.
         fmt ("json" | "jsonl" | "yaml" | "mpk"): If provided, overrides the
             auto-detected format.
+        stream (bool): Return an iterator over the items of a top-level JSON
+            array (requires ``ijson``) or over the records of a JSON lines
+            file, parsing one item at a time instead of the whole file. Items
+            are decoded with ``cls`` (``MontyDecoder`` or a subclass by
+            default, ``None`` to opt out). JSON lines records are decoded
+            exactly as without ``stream``; items of a JSON array only get
+            ``process_decoded``, so MongoDB extended JSON (``{"$oid": ...}``)
+            in them is not converted even when bson is installed. Other
+            ``json`` options raise ``TypeError``, and a JSON root other than
+            an array raises ``ValueError``.
         **kwargs: Any of the kwargs supported by ``json``/``yaml``/``msgpack.load``.
 
     Returns:
-        object: Result of ``json``/``yaml``/``msgpack.load``.
+        object: Result of ``json``/``yaml``/``msgpack.load``, or an iterator
+            of items if ``stream`` is set.
 
     """
     fmt = fmt or _identify_format(fn)
 
+    if stream:
+        if fmt not in {"json", "jsonl"}:
+            raise TypeError(f"Streaming is not supported for format: {fmt}")
+        cls = kwargs.pop("cls", MontyDecoder)
+        if args or kwargs:
+            raise TypeError(
+                f"Streaming does not support json options: {(*args, *kwargs)}"
+            )
+        if cls is None:
+            decoder = None
+        elif isinstance(cls, type) and issubclass(cls, MontyDecoder):
+            decoder = _MONTY_DECODER if cls is MontyDecoder else cls()
+        else:
+            raise TypeError(
+                f"Streaming requires cls to be a MontyDecoder subclass or None, got {cls}"
+            )
+        if fmt == "jsonl":
+            return _iter_json_lines(fn, decoder)
+        return _iter_json_array(fn, decoder)
+
     if fmt == "mpk":
         if msgpack is None:
             raise RuntimeError(
@@ -148,31 +494,65 @@ def loadfn(
             )
         if "object_hook" not in kwargs:
             kwargs["object_hook"] = object_hook
-        with zopen(fn, mode="rb") as fp:
-            return msgpack.load(fp, *args, **kwargs)  # pylint: disable=E1101
+        # ``msgpack.load`` reads the whole file into one ``bytes`` before
+        # unpacking. An ``Unpacker`` feeds the C parser 1 MiB blocks instead,
+        # so the raw file is never held in memory next to the result.
+        with _open_binary(fn) as fp:
+            unpacker = msgpack.Unpacker(
+                fp, *args, read_size=1024 * 1024, max_buffer_size=0, **kwargs
+            )
+            # Keep ``unpackb``'s errors for truncated and trailing data.
+            try:
+                obj = unpacker.unpack()
+            except msgpack.OutOfData:
+                raise ValueError("Unpack failed: incomplete input") from None
+            if extra := unpacker.read_bytes(1):
+                raise msgpack.ExtraData(obj, extra)
+            return obj
+    elif fmt in {"json", "jsonl"}:
+        # Read bytes: both parsers validate and decode UTF-8 themselves, so
+        # there is no separate decode pass into a file-sized ``str``.
+        with _open_binary(fn) as fp:
+            if _is_default_json_load(args, kwargs):
+                decoder = (
+                    None if kwargs.get("cls", MontyDecoder) is None else _MONTY_DECODER
+                )
+                if fmt == "jsonl":
+                    loads = _loads_json
+                    # Iterating the binary stream already splits lines in C
+                    # (the compressed streams are buffered by
+                    # ``_open_binary``), and unlike ``read().splitlines()``
+                    # never holds the whole file. ``isspace`` skips blank
+                    # lines without copying each line as ``strip`` would.
+                    return [loads(line, decoder) for line in fp if not line.isspace()]
+                return _loads_json_file(fp, decoder)
+
+            if "cls" not in kwargs:
+                kwargs["cls"] = MontyDecoder
+            if fmt == "jsonl":
+                json_loads = json.loads
+                return [
+                    json_loads(line, *args, **kwargs)
+                    for line in fp
+                    if not line.isspace()
+                ]
+            return json.loads(fp.read(), *args, **kwargs)
     else:
         with zopen(fn, mode="rt", encoding="utf-8") as fp:
             if fmt == "yaml":
-                if YAML is None:
-                    raise RuntimeError("Loading of YAML files requires ruamel.yaml.")
                 # ``cls`` is a monty-level kwarg (not ruamel.yaml's) — pop it
                 # before forwarding so ``YAML.load`` doesn't choke. Passing
                 # ``cls=None`` opts out of MSONable reconstruction, matching
                 # the JSON path's escape hatch.
                 cls = kwargs.pop("cls", MontyDecoder)
-                loaded = _get_yaml().load(fp, *args, **kwargs)
+                if yaml is not None:
+                    loaded = yaml.load(fp, *args, Loader=_YAML_LOADER, **kwargs)
+                else:
+                    loaded = _get_yaml().load(fp, *args, **kwargs)
                 if cls is not None:
-                    loaded = MontyDecoder().process_decoded(loaded)
+                    loaded = _MONTY_DECODER.process_decoded(loaded)
                 return loaded
 
-            if fmt in {"json", "jsonl"}:
-                if "cls" not in kwargs:
-                    kwargs["cls"] = MontyDecoder
-
-                if fmt == "jsonl":
-                    return [json.loads(jline, *args, **kwargs) for jline in fp]
-                return json.load(fp, *args, **kwargs)
-
             raise TypeError(f"Invalid format: {fmt}")
 
 
@@ -186,10 +566,12 @@ def dumpfn(
     """Dump an object to a JSON/JSONL/YAML/msgpack file by filename.
 
     Supports BZ2 (``.bz2``), GZIP (``.gz``, ``.z``), XZ (``.xz``, ``.lzma``)
-    compressed outputs transparently. YAML support requires ``ruamel.yaml``.
+    compressed outputs transparently. YAML is emitted with PyYAML's C
+    ``CSafeDumper`` when PyYAML is installed, otherwise with ``ruamel.yaml``.
     Format is auto-detected from the (case-insensitive) extension: ``.yaml``
     / ``.yml`` → YAML; ``.mpk`` → msgpack; ``.jsonl`` → JSON lines; otherwise
-    JSON.
+    JSON. JSON lines records are written with compact ``(",", ":")``
+    separators unless ``separators`` or ``indent`` is passed.
 
     Args:
         obj (object): Object to dump.
@@ -216,20 +598,47 @@ def dumpfn(
             fp = cast(TextIO, fp)
 
             if fmt == "yaml":
-                if YAML is None:
-                    raise RuntimeError("Loading of YAML files requires ruamel.yaml.")
-                _get_yaml().dump(obj, fp, *args, **kwargs)
+                if yaml is not None:
+                    # Match ruamel.yaml's output: insertion order, raw unicode.
+                    kwargs.setdefault("sort_keys", False)
+                    kwargs.setdefault("allow_unicode", True)
+                    yaml.dump(obj, fp, *args, Dumper=_MontyYAMLDumper, **kwargs)
+                else:
+                    _get_yaml().dump(obj, fp, *args, **kwargs)
             elif fmt in {"json", "jsonl"}:
-                if "cls" not in kwargs:
-                    kwargs["cls"] = MontyEncoder
+                # ``json.dumps(o, cls=cls, **kwargs)`` constructs
+                # ``cls(**kwargs)`` on every call. Build the encoder once
+                # instead, or reuse the shared one when no options are given.
+                cls = kwargs.pop("cls", MontyEncoder) or json.JSONEncoder
+                if fmt == "jsonl" and kwargs.get("indent") is None:
+                    # One record per line has no use for the padded default
+                    # separators; compact output is the usual NDJSON form.
+                    kwargs.setdefault("separators", (",", ":"))
+                encoder: json.JSONEncoder
+                if cls is MontyEncoder and not args and not kwargs:
+                    encoder = _MONTY_ENCODER
+                else:
+                    encoder = cls(*args, **kwargs)
+                encode = encoder.encode
                 if fmt == "jsonl":
+                    # Encode records into a buffer and write it out every
+                    # ``_JSONL_WRITE_CHUNK`` records, so the (possibly
+                    # compressed) stream sees a few large writes rather than
+                    # two small ones per record. Bound methods are hoisted
+                    # out of the per-record loop.
                     write = fp.write
-                    for jobj in obj:  # type: ignore[var-annotated,attr-defined]
-                        # Two writes avoid creating an intermediate ``str + "\n"``
-                        # for every record.
-                        write(json.dumps(jobj, *args, **kwargs))
-                        write("\n")
+                    buf: list[str] = []
+                    append = buf.append
+                    for jobj in obj:  # type: ignore[attr-defined]
+                        append(encode(jobj))
+                        if len(buf) >= _JSONL_WRITE_CHUNK:
+                            buf.append("")
+                            write("\n".join(buf))
+                            buf.clear()
+                    if buf:
+                        buf.append("")
+                        write("\n".join(buf))
                 else:
-                    fp.write(json.dumps(obj, *args, **kwargs))
+                    fp.write(encode(obj))
             else:
                 raise TypeError(f"Invalid format: {fmt}")
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import datetime
-import glob
+import decimal
 import json
-import os
 import pathlib
+from collections import OrderedDict
 
 import numpy as np
 import pytest
 
-from monty.json import MSONable, TypeHandler, register, unregister
-from monty.serialization import dumpfn, loadfn
-from monty.tempfile import ScratchDir
+import monty.serialization
+from monty.json import MontyDecoder, MSONable, TypeHandler, register, unregister
+from monty.serialization import _identify_format, dumpfn, loadfn
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 try:
     import msgpack
@@ -27,24 +32,48 @@ class toyMsonable(MSONable):
         self.b = b
 
     def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            return False
-
-        return all(
-            hasattr(other, attr) and getattr(other, attr, None) == getattr(self, attr)
-            for attr in {"a", "b"}
+        return (
+            isinstance(other, toyMsonable) and self.a == other.a and self.b == other.b
         )
 
 
+@pytest.fixture(params=["pyyaml", "ruamel"])
+def yaml_backend(request, monkeypatch):
+    """Run a test with PyYAML and with the ruamel.yaml fallback."""
+    if request.param == "pyyaml":
+        pytest.importorskip("yaml")
+    else:
+        monkeypatch.setattr(monty.serialization, "yaml", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ("file_name", "fmt"),
+    [
+        ("data.json", "json"),
+        ("data.JSON.GZ", "json"),
+        ("data.jsonl.bz2", "jsonl"),
+        ("myjsonlist.json", "json"),
+        ("/tmp/jsonl_dir/foo.yaml", "yaml"),
+        ("conf.yml.xz", "yaml"),
+        ("/long/dir/name/data.JSONL.LZMA", "jsonl"),
+        ("data.notjsonl.lzma", "json"),
+        ("data.mpk", "mpk"),
+        ("data.mpkfoo", "json"),
+        ("/tmp/dir.yaml/data", "json"),
+        ("yaml", "json"),
+        ("yaml.gz", "json"),
+        (pathlib.Path("data.jsonl"), "jsonl"),
+    ],
+)
+def test_identify_format(file_name, fmt):
+    assert _identify_format(file_name) == fmt
+    # Cached result is identical.
+    assert _identify_format(file_name) == fmt
+
+
 class TestSerial:
-    @classmethod
-    def teardown_class(cls):
-        # Cleans up test files if a test fails
-        files_to_clean_up = glob.glob("monte_test.*")
-        for fn in files_to_clean_up:
-            os.remove(fn)
-
-    def test_dumpfn_loadfn(self, tmp_dir):
+    def test_dumpfn_loadfn(self, tmp_path, yaml_backend):
         d = {"hello": "world"}
 
         # Test standard configuration
@@ -57,126 +86,288 @@ class TestSerial:
             "json.bz2",
             "yaml.bz2",
         ):
-            fn = f"monte_test.{ext}"
+            fn = tmp_path / f"monte_test.{ext}"
             dumpfn(d, fn)
             d2 = loadfn(fn)
             assert d == d2, f"Test file with extension {ext} did not parse correctly"
 
         # Test custom kwarg configuration
-        dumpfn(d, "monte_test.json", indent=4)
-        d2 = loadfn("monte_test.json")
+        dumpfn(d, tmp_path / "monte_test.json", indent=4)
+        d2 = loadfn(tmp_path / "monte_test.json")
         assert d == d2
-        dumpfn(d, "monte_test.yaml")
-        d2 = loadfn("monte_test.yaml")
+        dumpfn(d, tmp_path / "monte_test.yaml")
+        d2 = loadfn(tmp_path / "monte_test.yaml")
         assert d == d2
 
         # Check if fmt override works.
-        dumpfn(d, "monte_test.json", fmt="yaml")
+        dumpfn(d, tmp_path / "monte_test.json", fmt="yaml")
         with pytest.raises(json.decoder.JSONDecodeError):
-            loadfn("monte_test.json")
-        d2 = loadfn("monte_test.json", fmt="yaml")
+            loadfn(tmp_path / "monte_test.json")
+        d2 = loadfn(tmp_path / "monte_test.json", fmt="yaml")
         assert d == d2
 
         with pytest.raises(TypeError):
-            dumpfn(d, "monte_test.txt", fmt="garbage")
+            dumpfn(d, tmp_path / "monte_test.txt", fmt="garbage")
         with pytest.raises(TypeError):
-            loadfn("monte_test.txt", fmt="garbage")
+            loadfn(tmp_path / "monte_test.txt", fmt="garbage")
+
+    def test_json_msonable_nonfinite_bigint(self, tmp_path):
+        """MSONable, NaN and >64-bit ints load from JSON regardless of parser."""
+        d = {"obj": toyMsonable(a=1, b="1"), "nan": float("nan"), "big": 2**70}
+        dumpfn(d, tmp_path / "monte_test.json")
+        d2 = loadfn(tmp_path / "monte_test.json")
+        assert d2["obj"] == d["obj"]
+        assert np.isnan(d2["nan"])
+        assert d2["big"] == 2**70
+
+        d2 = loadfn(tmp_path / "monte_test.json", cls=None)
+        assert d2["obj"]["@class"] == "toyMsonable"
+
+        # Extra json options go through the stdlib parser.
+        for ext in ("json", "jsonl"):
+            dumpfn([{"x": 0.1, "obj": d["obj"]}], tmp_path / f"monte_test.{ext}")
+            (d2,) = loadfn(
+                tmp_path / f"monte_test.{ext}", cls=None, parse_float=decimal.Decimal
+            )
+            assert d2["x"] == decimal.Decimal("0.1")
+            assert d2["obj"]["@class"] == "toyMsonable"
+
+    def test_json_bson_extended(self, tmp_path, monkeypatch):
+        """With bson installed, only extended-JSON input goes through decode."""
+        calls = []
+        decode = MontyDecoder.decode
+
+        def spy(self, s):
+            calls.append(s)
+            return decode(self, s)
+
+        monkeypatch.setattr(monty.serialization, "bson", object())
+        monkeypatch.setattr(MontyDecoder, "decode", spy)
+        for ext in ("json", "jsonl"):
+            fn = tmp_path / f"monte_test.{ext}"
+            dumpfn([{"obj": toyMsonable(a=1, b="1")}], fn)
+            assert loadfn(fn)[0]["obj"] == toyMsonable(a=1, b="1")
+            assert not calls
+
+            dumpfn([{"_id": {"$oid": "0" * 24}}], fn)
+            assert loadfn(fn) == [{"_id": {"$oid": "0" * 24}}]
+            assert len(calls) == 1
+            assert loadfn(fn, cls=None) == [{"_id": {"$oid": "0" * 24}}]
+            assert len(calls) == 1
+            calls.clear()
+
+        # Streamed JSON lines records take the same route.
+        assert list(loadfn(fn, stream=True)) == [{"_id": {"$oid": "0" * 24}}]
+        assert len(calls) == 1
+
+    def test_large_json(self, tmp_path):
+        """Files above the memory-map threshold load like small ones."""
+        objs = [toyMsonable(a=i, b=str(i)) for i in range(20_000)]
+        # NaN takes the stdlib fallback when orjson is installed.
+        for d in ({"objs": objs}, {"objs": objs, "nan": float("nan")}):
+            for ext in ("json", "json.gz"):
+                fn = tmp_path / f"monte_test.{ext}"
+                dumpfn(d, fn)
+                d2 = loadfn(fn)
+                assert d2["objs"] == objs
+                assert "nan" not in d or np.isnan(d2["nan"])
+                assert loadfn(fn, cls=None)["objs"][0]["@class"] == "toyMsonable"
+        assert (tmp_path / "monte_test.json").stat().st_size > 1024 * 1024
 
     @pytest.mark.skipif(msgpack is None, reason="msgpack-python not installed.")
-    def test_mpk(self, tmp_dir):
+    def test_mpk(self, tmp_path):
         d = {"hello": "world"}
 
         # Test automatic format detection
-        dumpfn(d, "monte_test.mpk")
-        d2 = loadfn("monte_test.mpk")
+        dumpfn(d, tmp_path / "monte_test.mpk")
+        d2 = loadfn(tmp_path / "monte_test.mpk")
         assert d == d2
 
+        # Larger than one read block, with MSONable objects and compression.
+        objs = [toyMsonable(a=i, b=str(i) * 10) for i in range(50_000)]
+        dumpfn(objs, tmp_path / "monte_test.mpk.gz")
+        assert loadfn(tmp_path / "monte_test.mpk.gz") == objs
+
+        with open(tmp_path / "monte_test.mpk", "ab") as f:
+            f.write(msgpack.packb(1))
+        with pytest.raises(msgpack.ExtraData):
+            loadfn(tmp_path / "monte_test.mpk")
+        # Incomplete or invalid trailing bytes are extra data too.
+        for extra in (b"\x92", b"\xc1"):
+            with open(tmp_path / "monte_test.mpk", "wb") as f:
+                f.write(msgpack.packb(d) + extra)
+            with pytest.raises(msgpack.ExtraData):
+                loadfn(tmp_path / "monte_test.mpk")
+        for data in (b"", msgpack.packb(d)[:-1]):
+            with open(tmp_path / "monte_test.mpk", "wb") as f:
+                f.write(data)
+            with pytest.raises(ValueError, match="incomplete input"):
+                loadfn(tmp_path / "monte_test.mpk")
+
         # Test to ensure basename is respected, and not directory
-        with ScratchDir("."):
-            os.mkdir("mpk_test")
-            os.chdir("mpk_test")
-            fname = os.path.abspath("test_file.json")
-            dumpfn({"test": 1}, fname)
-            with open("test_file.json", encoding="utf-8") as f:
-                reloaded = json.loads(f.read())
-            assert reloaded["test"] == 1
-
-    def test_json_lines(self, tmp_dir):
+        fname = tmp_path / "mpk_test" / "test_file.json"
+        fname.parent.mkdir()
+        dumpfn({"test": 1}, fname)
+        with open(fname, encoding="utf-8") as f:
+            reloaded = json.loads(f.read())
+        assert reloaded["test"] == 1
+
+    def test_json_lines(self, tmp_path):
         d = [
             {"obj": toyMsonable(a=i, b=str(i)), "other": 1.0, "stuff": {"c": 3, "d": 4}}
             for i in range(5)
         ]
-        dumpfn(d, "monte_test.jsonl.gz")
-        new_d = loadfn("monte_test.jsonl.gz")
+        dumpfn(d, tmp_path / "monte_test.jsonl.gz")
+        new_d = loadfn(tmp_path / "monte_test.jsonl.gz")
         assert all(new_d[i] == entry for i, entry in enumerate(d))
         assert all(isinstance(entry["obj"], toyMsonable) for entry in new_d)
 
-        new_d = loadfn("monte_test.jsonl.gz", cls=None)
+        # Spans several write chunks, including a partial final one.
+        many = [{"i": i} for i in range(2500)]
+        dumpfn(many, tmp_path / "monte_test.jsonl")
+        with open(tmp_path / "monte_test.jsonl", encoding="utf-8") as f:
+            raw = f.read()
+        assert raw.count("\n") == len(many)
+        assert raw.startswith('{"i":0}\n')
+        # ``indent`` keeps json's ": " key separator.
+        dumpfn(many[:1], tmp_path / "monte_test_indent.jsonl", indent=1)
+        with open(tmp_path / "monte_test_indent.jsonl", encoding="utf-8") as f:
+            assert f.read() == '{\n "i": 0\n}\n'
+        assert loadfn(tmp_path / "monte_test.jsonl") == many
+        # Blank lines and a missing final newline are tolerated.
+        with open(tmp_path / "monte_test.jsonl", "w", encoding="utf-8") as f:
+            f.write('{"i": 0}\n\n  \n{"i": 1}')
+        assert loadfn(tmp_path / "monte_test.jsonl") == many[:2]
+        assert loadfn(tmp_path / "monte_test.jsonl", parse_int=int) == many[:2]
+
+        new_d = loadfn(tmp_path / "monte_test.jsonl.gz", cls=None)
         assert all(
             isinstance(entry["obj"], dict)
             and toyMsonable.from_dict(entry["obj"]) == d[i]["obj"]
             for i, entry in enumerate(new_d)
         )
 
-    def test_yaml_msonable_roundtrip(self, tmp_dir):
+    @pytest.mark.skipif(ijson is None, reason="ijson not installed.")
+    def test_stream(self, tmp_path):
+        d = [{"obj": toyMsonable(a=i, b=str(i)), "x": i + 0.5} for i in range(5)]
+        for ext in ("json", "json.gz", "jsonl", "jsonl.gz"):
+            fn = tmp_path / f"monte_test.{ext}"
+            dumpfn(d, fn)
+            items = loadfn(fn, stream=True)
+            assert not isinstance(items, list)
+            assert list(items) == d
+
+            raw = list(loadfn(fn, stream=True, cls=None))
+            assert raw[0]["obj"]["@class"] == "toyMsonable"
+
+        with pytest.raises(TypeError, match="Streaming is not supported"):
+            loadfn(tmp_path / "monte_test.yaml", stream=True)
+        with pytest.raises(TypeError, match="MontyDecoder"):
+            loadfn(fn, stream=True, cls=json.JSONDecoder)
+        with pytest.raises(TypeError, match="json options"):
+            loadfn(fn, stream=True, parse_float=decimal.Decimal)
+
+        dumpfn({"obj": d[0]}, tmp_path / "monte_test.json")
+        with pytest.raises(ValueError, match="top-level JSON array"):
+            loadfn(tmp_path / "monte_test.json", stream=True)
+
+        for ext in ("json", "jsonl"):
+            with pytest.raises(FileNotFoundError):
+                loadfn(tmp_path / f"missing.{ext}", stream=True)
+
+    def test_yaml_msonable_roundtrip(self, tmp_path, yaml_backend):
         """MSONable subclasses round-trip through YAML (issue #587)."""
         obj = toyMsonable(a=7, b="seven")
-        dumpfn(obj, "monte_test.yaml")
-        reloaded = loadfn("monte_test.yaml")
+        dumpfn(obj, tmp_path / "monte_test.yaml")
+        reloaded = loadfn(tmp_path / "monte_test.yaml")
         assert isinstance(reloaded, toyMsonable)
         assert reloaded == obj
 
         # Nested inside list and dict.
         nested = {"items": [toyMsonable(a=i, b=str(i)) for i in range(3)]}
-        dumpfn(nested, "monte_test.yaml")
-        reloaded = loadfn("monte_test.yaml")
+        dumpfn(nested, tmp_path / "monte_test.yaml")
+        reloaded = loadfn(tmp_path / "monte_test.yaml")
         assert all(isinstance(o, toyMsonable) for o in reloaded["items"])
         assert reloaded["items"] == nested["items"]
 
         # ``cls=None`` opts out of reconstruction, mirroring the JSON path.
-        raw = loadfn("monte_test.yaml", cls=None)
+        raw = loadfn(tmp_path / "monte_test.yaml", cls=None)
         assert isinstance(raw["items"][0], dict)
         assert raw["items"][0]["@class"] == "toyMsonable"
 
-    def test_yaml_numpy_path_roundtrip(self, tmp_dir):
+    def test_yaml_numpy_path_roundtrip(self, tmp_path, yaml_backend):
         """numpy arrays and pathlib paths round-trip through YAML."""
         payload = {
             "arr": np.array([1.0, 2.0, 3.0]),
             "p": pathlib.Path("/tmp/example"),
         }
-        dumpfn(payload, "monte_test.yaml")
-        reloaded = loadfn("monte_test.yaml")
+        dumpfn(payload, tmp_path / "monte_test.yaml")
+        reloaded = loadfn(tmp_path / "monte_test.yaml")
         assert isinstance(reloaded["arr"], np.ndarray)
         np.testing.assert_array_equal(reloaded["arr"], payload["arr"])
         assert isinstance(reloaded["p"], pathlib.PurePath)
         assert reloaded["p"] == payload["p"]
 
-    def test_yaml_preserves_native_datetime(self, tmp_dir):
+    def test_yaml_preserves_native_datetime(self, tmp_path, yaml_backend):
         """datetime keeps ruamel.yaml's native rendering (no @module envelope)."""
         when = datetime.datetime(2026, 5, 18, 12, 0, 0)
-        dumpfn({"when": when}, "monte_test.yaml")
-        with open("monte_test.yaml", encoding="utf-8") as f:
+        dumpfn({"when": when}, tmp_path / "monte_test.yaml")
+        with open(tmp_path / "monte_test.yaml", encoding="utf-8") as f:
             raw = f.read()
         # Native ruamel.yaml emits the timestamp as a bare scalar, not as a
         # ``@module``/``@class`` envelope.
         assert "@module" not in raw
         assert "2026-05-18" in raw
-        reloaded = loadfn("monte_test.yaml")
+        reloaded = loadfn(tmp_path / "monte_test.yaml")
         assert reloaded["when"] == when
 
-    def test_yaml_plain_dict_unchanged(self, tmp_dir):
+    def test_yaml_plain_dict_unchanged(self, tmp_path, yaml_backend):
         """Plain dict YAML output is byte-identical to pre-#587 behavior."""
-        dumpfn({"hello": "world"}, "monte_test.yaml")
-        with open("monte_test.yaml", encoding="utf-8") as f:
+        dumpfn({"hello": "world"}, tmp_path / "monte_test.yaml")
+        with open(tmp_path / "monte_test.yaml", encoding="utf-8") as f:
             raw = f.read()
         assert raw == "hello: world\n"
 
-    def test_yaml_thread_safe_roundtrip(self, tmp_dir):
+    def test_yaml_ordered_dict_unicode_roundtrip(self, tmp_path, yaml_backend):
+        """dict subclasses and non-ASCII text round-trip through YAML."""
+        payload = OrderedDict([("b", "\u00e9t\u00e9"), ("a", [1, 2])])
+        dumpfn(payload, tmp_path / "monte_test.yaml")
+        with open(tmp_path / "monte_test.yaml", encoding="utf-8") as f:
+            raw = f.read()
+        assert raw.index("b:") < raw.index("a:")
+        assert "\u00e9t\u00e9" in raw
+        assert loadfn(tmp_path / "monte_test.yaml") == dict(payload)
+
+    def test_yaml_1_2_scalars(self, tmp_path, yaml_backend):
+        """Plain scalars resolve with YAML 1.2 rules, not YAML 1.1 ones."""
+        fn = tmp_path / "monte_test.yaml"
+        fn.write_text(
+            "answer: no\ncountry: NO\nswitch: on\ntime: 1:30\n"
+            "c: 010\nh: 0x1F\no: 0o17\nf: 1e3\nt: True\n",
+            encoding="utf-8",
+        )
+        assert loadfn(fn) == {
+            "answer": "no",
+            "country": "NO",
+            "switch": "on",
+            "time": "1:30",
+            "c": 10,
+            "h": 31,
+            "o": 15,
+            "f": 1000.0,
+            "t": True,
+        }
+
+        strings = {"a": "no", "b": "010", "c": "1e3", "d": "0o17", "e": "on"}
+        dumpfn(strings, fn)
+        assert loadfn(fn) == strings
+
+    def test_yaml_thread_safe_roundtrip(self, tmp_path, yaml_backend):
         """Concurrent dumpfn/loadfn from threads do not corrupt YAML state (issue #795)."""
         import concurrent.futures
 
         def worker(idx: int) -> dict:
-            fn = f"monte_test_{idx}.yaml"
+            fn = tmp_path / f"monte_test_{idx}.yaml"
             payload = {
                 "obj": toyMsonable(a=idx, b=str(idx)),
                 "arr": np.array([float(idx), float(idx) + 1.0]),
@@ -196,7 +387,7 @@ class TestSerial:
             np.testing.assert_array_equal(result["arr"], [float(idx), float(idx) + 1.0])
             assert result["p"] == pathlib.Path(f"/tmp/{idx}")
 
-    def test_yaml_user_typehandler(self, tmp_dir):
+    def test_yaml_user_typehandler(self, tmp_path, yaml_backend):
         """User-registered TypeHandlers participate in YAML round-trip."""
 
         class MyType:
@@ -227,8 +418,8 @@ class TestSerial:
         register(handler)
         try:
             obj = MyType(42)
-            dumpfn(obj, "monte_test.yaml")
-            reloaded = loadfn("monte_test.yaml")
+            dumpfn(obj, tmp_path / "monte_test.yaml")
+            reloaded = loadfn(tmp_path / "monte_test.yaml")
             assert isinstance(reloaded, MyType)
             assert reloaded == obj
         finally: